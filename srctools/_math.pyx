@@ -310,7 +310,7 @@ cdef inline void _mat_to_angle(vec_t *ang, mat_t mat):
         ang.z = 0.0  # Can't produce.
 
 
-cdef bint _mat_from_basis(mat_t mat, Vec x, Vec y, Vec z) except True:
+cdef bint _mat_from_basis(mat_t mat, Vec x, Vec y, Vec z, bint normalise=True) except True:
     """Implement the shared parts of Matrix/Angle .from_basis()."""
     cdef vec_t res
 
@@ -322,7 +322,8 @@ cdef bint _mat_from_basis(mat_t mat, Vec x, Vec y, Vec z) except True:
     else:
         res = x.val
 
-    _vec_normalise(&res, &res)
+    if normalise:
+        _vec_normalise(&res, &res)
     mat[0] = res.x, res.y, res.z
 
     if y is None:
@@ -333,7 +334,8 @@ cdef bint _mat_from_basis(mat_t mat, Vec x, Vec y, Vec z) except True:
     else:
         res = y.val
 
-    _vec_normalise(&res, &res)
+    if normalise:
+        _vec_normalise(&res, &res)
     mat[1] = res.x, res.y, res.z
 
     if z is None:
@@ -344,7 +346,8 @@ cdef bint _mat_from_basis(mat_t mat, Vec x, Vec y, Vec z) except True:
     else:
         res = z.val
 
-    _vec_normalise(&res, &res)
+    if normalise:
+        _vec_normalise(&res, &res)
     mat[2] = res.x, res.y, res.z
     return False
 
@@ -1983,13 +1986,16 @@ cdef class Matrix:
         x: Vec=None,
         y: Vec=None,
         z: Vec=None,
+        bint normalise=True,
     ) -> 'Matrix':
         """Construct a matrix from at least two basis vectors.
 
-        The third is computed, if not provided.
+        The third is computed, if not provided. If normalise is False, the
+        vectors are used as-is - they must already be unit length, or the
+        matrix will not be a valid rotation.
         """
         cdef Matrix mat = Matrix.__new__(cls)
-        _mat_from_basis(mat.mat, x, y, z)
+        _mat_from_basis(mat.mat, x, y, z, normalise)
         return mat
 
     def __matmul__(first, second):
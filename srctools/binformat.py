@@ -53,7 +53,8 @@ def read_offset_array(file: IO[bytes], count: int) -> List[str]:
 
 def str_readvec(file: IO[bytes]) -> Vec:
     """Read a vector from a file."""
-    return Vec(ST_VEC.unpack(file.read(ST_VEC.size)))
+    # Pass the axes separately, so Vec doesn't need to iterate the tuple.
+    return Vec(*ST_VEC.unpack(file.read(ST_VEC.size)))
 
 
 def checksum(data: bytes, prior=0) -> int:
@@ -1,7 +1,11 @@
 """Read and write lumps in Source BSP files.
 
 """
+import array
 import contextlib
+import mmap
+import re
+import sys
 
 from io import BytesIO
 from enum import Enum, Flag
@@ -12,11 +16,13 @@ from zipfile import ZipFile
 from srctools import AtomicWriter, Vec, Angle, conv_int
 from srctools.vmf import VMF, Entity, Output
 from srctools.tokenizer import escape_text
-from srctools.binformat import struct_read, DeferredWrites
+from srctools.binformat import struct_read
 from srctools.property_parser import Property
 import struct
 
-from typing import List, Dict, Iterator, Union, Optional, BinaryIO, Tuple
+from typing import (
+    List, Dict, Iterator, Union, Optional, BinaryIO, Tuple, Callable,
+)
 
 
 __all__ = [
@@ -30,6 +36,30 @@ BSP_MAGIC = b'VBSP'  # All BSP files start with this
 HEADER_1 = '<4si'  # Header section before the lump list.
 HEADER_LUMP = '<3i4s'  # Header section for each lump.
 HEADER_2 = '<i'  # Header section after the lumps.
+PLANE_STRUCT = struct.Struct('<ffffi')  # Normal, distance, axis flags.
+
+# Precompiled structs for reading and writing.
+ST_HEADER_LUMP = struct.Struct(HEADER_LUMP)
+ST_INT = struct.Struct('<i')
+ST_MODEL_NAME = struct.Struct('<128s')
+
+
+def _read_count(file: BinaryIO, lump_name: str, desc: str) -> int:
+    """Read a little-endian int count, checking the data didn't end first."""
+    data = file.read(4)
+    if len(data) != 4:
+        raise ValueError(f'{lump_name} is truncated: no {desc} count!')
+    return int.from_bytes(data, 'little', signed=True)
+
+# Matches each line in the entity lump, along with its line ending.
+# The lookahead stops an empty match after the last line.
+ENT_LINE_RE = re.compile(
+    rb'(?!\Z)(?:'
+    rb'(\{)|(\})|(\x00)|'  # Brackets, or the null at the end of the lump.
+    rb'"([^"\r\n]*)" "([^\r\n]*)"|'  # A keyvalue.
+    rb'([^\r\n]*)'  # Anything else is invalid, including blank lines.
+    rb')(?:\r\n|\r|\n|\Z)',
+)
 
 
 class VERSIONS(Enum):
@@ -165,6 +195,15 @@ class BSP_LUMPS(Enum):
     DISP_MULTIBLEND = 63
 
 LUMP_COUNT = max(lump.value for lump in BSP_LUMPS) + 1  # 64 normally
+# BSP.read() relies on there being no gaps in the values.
+if [lump.value for lump in BSP_LUMPS] != list(range(LUMP_COUNT)):
+    raise RuntimeError('BSP_LUMPS values must be sequential!')
+# The lumps start after the complete header.
+HEADER_SIZE = (
+    struct.calcsize(HEADER_1)
+    + struct.calcsize(HEADER_LUMP) * LUMP_COUNT
+    + struct.calcsize(HEADER_2)
+)
 
 # Special-case the packfile lump, put it at the end.
 # This way the BSP can be opened by generic zip programs.
@@ -173,6 +212,206 @@ LUMP_WRITE_ORDER.remove(BSP_LUMPS.PAKFILE)
 LUMP_WRITE_ORDER.append(BSP_LUMPS.PAKFILE)
 
 
+# The fields at the start of every static prop version: origin, angles,
+# model index, visleafs, solidity, flags, skin, fade distances, lighting origin.
+# These are named directly in the reader and writer templates.
+_STATIC_PROP_HEADER = '<6fH HHBBiff 3f'
+
+
+def _static_prop_fields(version: int) -> List[Tuple[str, str, str]]:
+    """Return the fields following the header for this static prop version.
+
+    Each is the struct format, the names it is read into, and the expression
+    used to write it. The struct, reader and writer are all built from this,
+    so they always agree on the layout.
+    """
+    fields = []
+    if version >= 5:
+        fields.append(('f', 'fade_scale', 'prop.fade_scale'))
+    if version in (6, 7):
+        fields.append(('H', 'min_dx_level', 'prop.min_dx_level'))
+        fields.append(('H', 'max_dx_level', 'prop.max_dx_level'))
+    if version >= 8:
+        fields.append(('B', 'min_cpu_level', 'prop.min_cpu_level'))
+        fields.append(('B', 'max_cpu_level', 'prop.max_cpu_level'))
+        fields.append(('B', 'min_gpu_level', 'prop.min_gpu_level'))
+        fields.append(('B', 'max_gpu_level', 'prop.max_gpu_level'))
+    if version >= 7:
+        # Alpha isn't used.
+        fields.append(('BBB', 'r, g, b', '*map(int, prop._tint)'))
+        fields.append(('B', 'renderfx', 'prop.renderfx'))
+    if version >= 11:
+        # Unknown data, though it's float-like. We always write zero.
+        fields.append(('i', 'unknown_1', '0'))
+    if version >= 10:
+        # Extra flags, post-CSGO.
+        fields.append(('I', 'flags_sec', 'flags >> 8'))
+    if version >= 11:
+        # XBox support was removed. Instead this is the scaling factor.
+        fields.append(('f', 'scaling', 'prop.scaling'))
+    elif version >= 9:
+        # The 1-byte bool gets expanded to the full 4-byte size.
+        fields.append(('?xxx', 'disable_on_xbox', 'prop.disable_on_xbox'))
+    return fields
+
+
+def _static_prop_struct(version: int) -> struct.Struct:
+    """Build the struct for a single static prop record in this version."""
+    return struct.Struct(_STATIC_PROP_HEADER + ''.join([
+        fmt for fmt, name, expr in _static_prop_fields(version)
+    ]))
+
+
+# The struct for a whole static prop, for each supported version.
+STATIC_PROP_STRUCTS = {
+    version: _static_prop_struct(version)
+    for version in range(4, 12)
+}
+
+# Template code for reading all the static props, specialised for each version.
+# This unpacks each record straight into the fields, instead of checking the
+# version for every prop.
+_STATIC_PROP_READ_TEMP = '''
+def read_props(data, model_dict, visleaf_list, flag_cache):
+    for (
+        x, y, z,
+        pitch, yaw, roll,
+        model_ind,
+        first_leaf,
+        leaf_count,
+        solidity,
+        flags,
+        skin,
+        min_fade,
+        max_fade,
+        light_x, light_y, light_z,{fields}
+    ) in iter_unpack(data):{flags_sec}
+        # Only a few combinations of flags are used, so reuse the members.
+        try:
+            prop_flags = flag_cache[flags]
+        except KeyError:
+            prop_flags = flag_cache[flags] = StaticPropFlags(flags)
+        # StaticProp converts the tuples to Vec/Angle only when accessed.
+        yield StaticProp(
+            model_dict[model_ind],
+            (x, y, z),
+            (pitch, yaw, roll),
+            {scaling},
+            visleaf_list[first_leaf:first_leaf + leaf_count].tolist(),
+            solidity,
+            prop_flags,
+            skin,
+            min_fade,
+            max_fade,
+            (light_x, light_y, light_z),
+            {fade_scale},
+            {min_dx_level},
+            {max_dx_level},
+            {min_cpu_level},
+            {max_cpu_level},
+            {min_gpu_level},
+            {max_gpu_level},
+            {tint},
+            {renderfx},
+            {disable_on_xbox},
+        )
+'''
+
+
+def _static_prop_reader(version: int) -> Callable[
+    [bytes, List[str], array.array, Dict[int, 'StaticPropFlags']],
+    Iterator['StaticProp'],
+]:
+    """Generate the function which reads all the static props in a lump."""
+    fields = [name for fmt, name, expr in _static_prop_fields(version)]
+    values = {
+        'scaling': '1.0',
+        'fade_scale': '1',
+        # Replaced by GPU & CPU in later versions.
+        'min_dx_level': '0',
+        'max_dx_level': '0',
+        'min_cpu_level': '0',
+        'max_cpu_level': '0',
+        'min_gpu_level': '0',
+        'max_gpu_level': '0',
+        # No tint.
+        'tint': '(255, 255, 255)',
+        'renderfx': '255',
+        'disable_on_xbox': 'False',
+        'flags_sec': '',
+    }
+    for field in fields:
+        if field in values:
+            values[field] = field
+    if 'r, g, b' in fields:
+        values['tint'] = '(r, g, b)'
+    if 'flags_sec' in fields:
+        values['flags_sec'] = '\n        flags |= flags_sec << 8'
+
+    namespace = {
+        'iter_unpack': STATIC_PROP_STRUCTS[version].iter_unpack,
+        'StaticProp': StaticProp,
+        'StaticPropFlags': StaticPropFlags,
+    }
+    exec(
+        _STATIC_PROP_READ_TEMP.format(
+            fields=''.join('\n        {},'.format(field) for field in fields),
+            **values,
+        ),
+        namespace,
+    )
+    return namespace['read_props']
+
+
+# The generated readers, built when first used since they need StaticProp.
+_STATIC_PROP_READERS = {}  # type: Dict[int, Callable[..., Iterator[StaticProp]]]
+
+# Template code for writing a static prop, specialised for each version.
+# The stored values are used directly, so props which were read but never
+# accessed don't need to construct Vecs.
+_STATIC_PROP_WRITE_TEMP = '''
+def write_prop(buf, off, prop, model_ind, leaf_off):
+    flags = prop.flags.value
+    pack_into(
+        buf, off,
+        *prop._origin,
+        *prop._angles,
+        model_ind,
+        leaf_off,
+        len(prop.visleafs),
+        prop.solidity,
+        flags & 0xFF,
+        prop.skin,
+        prop.min_fade,
+        prop.max_fade,
+        *prop._lighting,{fields}
+    )
+'''
+
+
+def _static_prop_writer(version: int) -> Callable[
+    [bytearray, int, 'StaticProp', int, int], None
+]:
+    """Generate the function which writes a single static prop."""
+    fields = [expr for fmt, name, expr in _static_prop_fields(version)]
+    prop_struct = STATIC_PROP_STRUCTS[version]
+
+    namespace = {'pack_into': prop_struct.pack_into}
+    exec(
+        _STATIC_PROP_WRITE_TEMP.format(
+            fields=''.join('\n        {},'.format(field) for field in fields),
+        ),
+        namespace,
+    )
+    return namespace['write_prop']
+
+
+STATIC_PROP_WRITERS = {
+    version: _static_prop_writer(version)
+    for version in STATIC_PROP_STRUCTS
+}
+
+
 class StaticPropFlags(Flag):
     """Bitflags specified for static props."""
     NONE = 0
@@ -233,10 +472,18 @@ class BSP:
 
             lump_offsets = {}
 
-            # Read the index describing each BSP lump.
-            for index in range(LUMP_COUNT):
-                offset, length, version, ident = struct_read(HEADER_LUMP, file)
-                lump_id = BSP_LUMPS(index)
+            # Read the index describing each BSP lump, and the map revision.
+            header_size = LUMP_COUNT * ST_HEADER_LUMP.size
+            header = file.read(header_size + 4)
+            if len(header) != header_size + 4:
+                raise ValueError('BSP file is truncated: incomplete header!')
+
+            # The lumps are in order, so iterating the enum matches them up
+            # without needing to look up each value.
+            for lump_id, (offset, length, version, ident) in zip(
+                BSP_LUMPS,
+                ST_HEADER_LUMP.iter_unpack(header[:header_size]),
+            ):
                 self.lumps[lump_id] = Lump(
                     lump_id,
                     version,
@@ -244,42 +491,60 @@ class BSP:
                 )
                 lump_offsets[lump_id] = offset, length
 
-            [self.map_revision] = struct_read(HEADER_2, file)
+            self.map_revision = int.from_bytes(header[header_size:], 'little', signed=True)
+
+            # Map the file, so lumps can be sliced out without seeking and
+            # reading for each one.
+            mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
 
+        with mapped:
             for lump in self.lumps.values():
                 # Now read in each lump.
                 offset, length = lump_offsets[lump.type]
-                file.seek(offset)
-                lump.data = file.read(length)
+                lump.data = mapped[offset:offset + length]
 
             game_lump = self.lumps[BSP_LUMPS.GAME_LUMP]
 
             self.game_lumps.clear()
 
-            [lump_count] = struct.unpack_from('<i', game_lump.data)
-            lump_offset = 4
-
-            for _ in range(lump_count):
-                (
-                    game_lump_id,
-                    flags,
-                    glump_version,
-                    file_off,
-                    file_len,
-                ) = GameLump.ST.unpack_from(game_lump.data, lump_offset)  # type: bytes, int, int, int, int
-                lump_offset += GameLump.ST.size
-
-                file.seek(file_off)
+            # Check the directory is all there, otherwise entries would be
+            # silently dropped and then deleted on save.
+            if len(game_lump.data) < 4:
+                raise ValueError('Game lump is truncated: no lump count!')
+            lump_count = int.from_bytes(game_lump.data[:4], 'little', signed=True)
+            glump_dir = game_lump.data[4:4 + lump_count * GameLump.ST.size]
+            if len(glump_dir) != lump_count * GameLump.ST.size:
+                raise ValueError(
+                    'Game lump is truncated: '
+                    f'expected {lump_count} game lump headers!'
+                )
+            # Position of each game lump in the file.
+            game_lump_pos: List[Tuple[int, int, GameLump]] = []
 
+            for (
+                game_lump_id,
+                flags,
+                glump_version,
+                file_off,
+                file_len,
+            ) in GameLump.ST.iter_unpack(glump_dir):  # type: bytes, int, int, int, int
                 # The lump ID is backward..
                 game_lump_id = game_lump_id[::-1]
 
-                self.game_lumps[game_lump_id] = GameLump(
+                self.game_lumps[game_lump_id] = glump = GameLump(
                     game_lump_id,
                     flags,
                     glump_version,
-                    file.read(file_len),
+                    b'',
                 )
+                game_lump_pos.append((file_off, file_len, glump))
+
+            # Then read the data in file order, so we go through the file
+            # sequentially. The dict still keeps the order of the headers.
+            game_lump_pos.sort(key=lambda pos: pos[0])
+            for file_off, file_len, glump in game_lump_pos:
+                glump.data = mapped[file_off:file_off + file_len]
+
             # This is not valid any longer.
             game_lump.data = b''
 
@@ -288,26 +553,37 @@ class BSP:
 
         game_lumps = list(self.game_lumps.values())  # Lock iteration order.
 
-        with AtomicWriter(filename or self.filename, is_bytes=True) as file:  # type: BinaryIO
-            # Needed to allow writing out the header before we know the position
-            # data will be.
-            defer = DeferredWrites(file)
-
-            if isinstance(self.version, VERSIONS):
-                version = self.version.value
+        if isinstance(self.version, VERSIONS):
+            version = self.version.value
+        else:
+            version = self.version
+
+        # All the sizes are known already, so first compute where each lump
+        # will be. Then everything can be written in one pass.
+        lump_pos: Dict[BSP_LUMPS, Tuple[int, int]] = {}
+        game_lump_offsets: List[int] = []
+        offset = HEADER_SIZE
+        for lump_name in LUMP_WRITE_ORDER:
+            if lump_name is BSP_LUMPS.GAME_LUMP:
+                # The count, then the header for each, then each lump's data.
+                glump_off = offset + 4 + GameLump.ST.size * len(game_lumps)
+                for game_lump in game_lumps:
+                    game_lump_offsets.append(glump_off)
+                    glump_off += len(game_lump.data)
+                length = glump_off - offset
             else:
-                version = self.version
+                length = len(self.lumps[lump_name].data)
+            lump_pos[lump_name] = offset, length
+            offset += length
 
+        with AtomicWriter(filename or self.filename, is_bytes=True) as file:  # type: BinaryIO
             file.write(struct.pack(HEADER_1, BSP_MAGIC, version))
 
             # Write headers.
             for lump_name in BSP_LUMPS:
                 lump = self.lumps[lump_name]
-                defer.defer(lump_name, '<ii')
-                file.write(struct.pack(
-                    HEADER_LUMP,
-                    0,  # offset
-                    0,  # length
+                file.write(ST_HEADER_LUMP.pack(
+                    *lump_pos[lump_name],
                     lump.version,
                     bytes(lump.ident),
                 ))
@@ -318,37 +594,24 @@ class BSP:
             # Then each lump.
             for lump_name in LUMP_WRITE_ORDER:
                 # Write out the actual data.
-                lump = self.lumps[lump_name]
                 if lump_name is BSP_LUMPS.GAME_LUMP:
                     # Construct this right here.
-                    lump_start = file.tell()
-                    file.write(struct.pack('<i', len(game_lumps)))
-                    for game_lump in game_lumps:
-                        file.write(struct.pack(
-                            '<4s HH',
+                    file.write(ST_INT.pack(len(game_lumps)))
+                    for game_lump, glump_off in zip(game_lumps, game_lump_offsets):
+                        file.write(GameLump.ST.pack(
                             game_lump.id[::-1],
                             game_lump.flags,
                             game_lump.version,
+                            glump_off,
+                            len(game_lump.data),
                         ))
-                        defer.defer(game_lump.id, '<i', write=True)
-                        file.write(struct.pack('<i', len(game_lump.data)))
 
                     # Now write data.
                     for game_lump in game_lumps:
-                        defer.set_data(game_lump.id, file.tell())
                         file.write(game_lump.data)
-                    # Length of the game lump is current - start.
-                    defer.set_data(
-                        lump_name,
-                        lump_start,
-                        file.tell() - lump_start,
-                    )
                 else:
                     # Normal lump.
-                    defer.set_data(lump_name, file.tell(), len(lump.data))
-                    file.write(lump.data)
-            # Apply all the deferred writes.
-            defer.write()
+                    file.write(self.lumps[lump_name].data)
 
     def read_header(self) -> None:
         """No longer used."""
@@ -402,16 +665,14 @@ class BSP:
 
         for off in table_offsets:
             # Look for the NULL at the end - strings are limited to 128 chars.
-            str_off = 0
-            for str_off in range(off, off + 128):
-                if tex_data[str_off] == 0:
-                    yield tex_data[off: str_off].decode('ascii')
-                    break
-            else:
+            try:
+                str_off = tex_data.index(b'\x00', off, off + 128)
+            except ValueError:
                 # Reached the 128 char limit without finding a null.
                 raise ValueError('Bad string at', off, 'in BSP! ("{}")'.format(
-                    tex_data[off:str_off]
-                ))
+                    tex_data[off:off + 128]
+                )) from None
+            yield tex_data[off: str_off].decode('ascii')
 
     @contextlib.contextmanager
     def packfile(self) -> Iterator[ZipFile]:
@@ -420,6 +681,9 @@ class BSP:
         When successfully exited, the zip will be rewritten to the BSP file.
         """
         pak_lump = self.lumps[BSP_LUMPS.PAKFILE]
+        # BytesIO shares the initial bytes object, and only copies it once
+        # the zip actually writes something. If it's left unmodified,
+        # getvalue() then returns the same object without any copying.
         data_file = BytesIO(pak_lump.data)
 
         zip_file = ZipFile(data_file, mode='a')
@@ -429,8 +693,6 @@ class BSP:
         yield zip_file
         # Explicitly close to finalise the footer.
         zip_file.close()
-        # Note: because data is bytes, CPython won't end up doing any copying
-        # here.
         pak_lump.data = data_file.getvalue()
 
     def read_ent_data(self) -> VMF:
@@ -447,8 +709,10 @@ class BSP:
         # This code performs the same thing as property_parser, but simpler
         # since there's no nesting, comments, or whitespace, except between
         # key and value. We also operate directly on the (ASCII) binary.
-        for line in ent_data.splitlines():
-            if line == b'{':
+        # A single regex matches each line, so we don't need to split.
+        for match in ENT_LINE_RE.finditer(ent_data):
+            is_open, is_close, is_null, key, value, bad_line = match.groups()
+            if is_open:
                 if cur_ent is not None:
                     raise ValueError(
                         '2 levels of nesting after {} ents'.format(
@@ -461,7 +725,7 @@ class BSP:
                 else:
                     cur_ent = Entity(vmf)
                 continue
-            elif line == b'}':
+            elif is_close:
                 if cur_ent is None:
                     raise ValueError(
                         f'Too many closing brackets after'
@@ -476,20 +740,24 @@ class BSP:
                     vmf.add_ent(cur_ent)
                 cur_ent = None
                 continue
-            elif line == b'\x00':  # Null byte at end of lump.
+            elif is_null:  # Null byte at end of lump.
                 if cur_ent is not None:
                     raise ValueError("Last entity didn't end!")
                 return vmf
 
             if cur_ent is None:
                 raise ValueError("Keyvalue outside brackets!")
+            if bad_line is not None:
+                raise ValueError(f'Invalid keyvalue line {bad_line!r}!')
 
             # Line is of the form <"key" "val">, but handle escaped quotes
             # in the value. Valve's parser doesn't allow that, but we might
             # as well be better...
-            key, value = line.split(b'" "', 2)
-            decoded_key = key[1:].decode('ascii')
-            decoded_value = value[:-1].replace(br'\"', b'"').decode('ascii')
+            decoded_key = key.decode('ascii')
+            if br'\"' in value:
+                decoded_value = value.replace(br'\"', b'"').decode('ascii')
+            else:
+                decoded_value = value.decode('ascii')
 
             # Now, we need to figure out if this is a keyvalue,
             # or connection.
@@ -524,19 +792,21 @@ class BSP:
 
         use_comma_sep can be used to force using either commas, or 0x1D in I/O.
         """
-        out = BytesIO()
+        # Build up the text, then encode it all at once.
+        out: List[str] = []
+        add = out.append
         for ent in itertools.chain([vmf.spawn], vmf.entities):
-            out.write(b'{\n')
+            add('{\n')
             for key, value in ent.keys.items():
-                out.write('"{}" "{}"\n'.format(key, escape_text(value)).encode('ascii'))
+                add(f'"{key}" "{escape_text(value)}"\n')
             for output in ent.outputs:
                 if use_comma_sep is not None:
                     output.comma_sep = use_comma_sep
-                out.write(output._get_text().encode('ascii'))
-            out.write(b'}\n')
-        out.write(b'\x00')
+                add(output._get_text())
+            add('}\n')
+        add('\x00')
 
-        return out.getvalue()
+        return ''.join(out).encode('ascii')
 
     def static_prop_models(self) -> Iterator[str]:
         """Yield all model filenames used in static props."""
@@ -546,9 +816,14 @@ class BSP:
     @staticmethod
     def _read_static_props_models(static_lump: BytesIO) -> Iterator[str]:
         """Read the static prop dictionary from the lump."""
-        [dict_num] = struct_read('<i', static_lump)
-        for _ in range(dict_num):
-            [padded_name] = struct_read('<128s', static_lump)
+        dict_num = _read_count(static_lump, 'Static prop lump', 'model')
+        name_data = static_lump.read(ST_MODEL_NAME.size * dict_num)
+        if len(name_data) != ST_MODEL_NAME.size * dict_num:
+            raise ValueError(
+                'Static prop lump is truncated: '
+                f'expected {dict_num} model names!'
+            )
+        for [padded_name] in ST_MODEL_NAME.iter_unpack(name_data):
             # Strip null chars off the end, and convert to a str.
             yield padded_name.rstrip(b'\x00').decode('ascii')
 
@@ -571,229 +846,118 @@ class BSP:
         # Array of model filenames.
         model_dict = list(self._read_static_props_models(static_lump))
 
-        [visleaf_count] = struct_read('<i', static_lump)
-        visleaf_list = list(struct_read('H' * visleaf_count, static_lump))
-
-        [prop_count] = struct_read('<i', static_lump)
-
-        for i in range(prop_count):
-            origin = Vec(struct_read('fff', static_lump))
-            angles = Angle(struct_read('fff', static_lump))
-
-            [model_ind] = struct_read('<H', static_lump)
-
-            (
-                first_leaf,
-                leaf_count,
-                solidity,
-                flags,
-                skin,
-                min_fade,
-                max_fade,
-            ) = struct_read('<HHBBiff', static_lump)
-
-            model_name = model_dict[model_ind]
-
-            visleafs = visleaf_list[first_leaf:first_leaf + leaf_count]
-            lighting_origin = Vec(struct_read('<fff', static_lump))
+        visleaf_count = _read_count(static_lump, 'Static prop lump', 'visleaf')
+        visleaf_data = static_lump.read(2 * visleaf_count)
+        if len(visleaf_data) != 2 * visleaf_count:
+            raise ValueError(
+                'Static prop lump is truncated: '
+                f'expected {visleaf_count} visleafs!'
+            )
+        visleaf_list = array.array('H')
+        visleaf_list.frombytes(visleaf_data)
+        if sys.byteorder == 'big':
+            visleaf_list.byteswap()
+
+        prop_count = _read_count(static_lump, 'Static prop lump', 'prop')
+        prop_start = static_lump.tell()
+        prop_size = prop_count * STATIC_PROP_STRUCTS[version].size
+        prop_data = static_lump.getvalue()[prop_start:prop_start + prop_size]
+        if len(prop_data) != prop_size:
+            raise ValueError(
+                'Static prop lump is truncated: '
+                f'expected {prop_count} props!'
+            )
 
-            if version >= 5:
-                fade_scale = struct_read('<f', static_lump)[0]
-            else:
-                fade_scale = 1  # default
+        try:
+            read_props = _STATIC_PROP_READERS[version]
+        except KeyError:
+            read_props = _STATIC_PROP_READERS[version] = _static_prop_reader(version)
 
-            if version in (6, 7):
-                min_dx_level, max_dx_level = struct_read('<HH', static_lump)
-            else:
-                # Replaced by GPU & CPU in later versions.
-                min_dx_level = max_dx_level = 0  # None
-
-            if version >= 8:
-                (
-                    min_cpu_level,
-                    max_cpu_level,
-                    min_gpu_level,
-                    max_gpu_level,
-                ) = struct_read('BBBB', static_lump)
-            else:
-                # None
-                min_cpu_level = max_cpu_level = 0
-                min_gpu_level = max_gpu_level = 0
-
-            if version >= 7:
-                r, g, b, renderfx = struct_read('BBBB', static_lump)
-                # Alpha isn't used.
-                tint = Vec(r, g, b)
-            else:
-                # No tint.
-                tint = Vec(255, 255, 255)
-                renderfx = 255
-
-            if version >= 11:
-                # Unknown data, though it's float-like.
-                unknown_1 = struct_read('<i', static_lump)
-
-            if version >= 10:
-                # Extra flags, post-CSGO.
-                flags |= struct_read('<I', static_lump)[0] << 8
-
-            flags = StaticPropFlags(flags)
-
-            scaling = 1.0
-            disable_on_xbox = False
-
-            if version >= 11:
-                # XBox support was removed. Instead this is the scaling factor.
-                [scaling] = struct_read("<f", static_lump)
-            elif version >= 9:
-                # The single boolean byte also produces 3 pad bytes.
-                [disable_on_xbox] = struct_read('<?xxx', static_lump)
-
-            yield StaticProp(
-                model_name,
-                origin,
-                angles,
-                scaling,
-                visleafs,
-                solidity,
-                flags,
-                skin,
-                min_fade,
-                max_fade,
-                lighting_origin,
-                fade_scale,
-                min_dx_level,
-                max_dx_level,
-                min_cpu_level,
-                max_cpu_level,
-                min_gpu_level,
-                max_gpu_level,
-                tint,
-                renderfx,
-                disable_on_xbox,
-            )
+        flag_cache = {}  # type: Dict[int, StaticPropFlags]
+        yield from read_props(prop_data, model_dict, visleaf_list, flag_cache)
 
     def write_static_props(self, props: List['StaticProp']) -> None:
         """Remake the static prop lump."""
 
         # First generate the visleaf and model-names block.
         # Unfortunately it seems reusing visleaf parts isn't possible.
-        leaf_array = []  # type: List[int]
+        leaf_array = array.array('H')
         leaf_offsets = []  # type: List[int]
 
-        models = set()
+        # Models are numbered in the order they're first used, which keeps
+        # the output consistent.
+        model_ind: Dict[str, int] = {}
 
         for prop in props:
             leaf_offsets.append(len(leaf_array))
             leaf_array.extend(prop.visleafs)
-            models.add(prop.model)
+            model_ind.setdefault(prop.model, len(model_ind))
 
-        # Lock down the order of the names.
-        model_list = list(models)
-        model_ind = {
-            mdl: i
-            for i, mdl in enumerate(model_list)
-        }
+        model_list = list(model_ind)
 
         game_lump = self.game_lumps[b'sprp']
 
+        # Each prop is a fixed size, so we can allocate the whole lump up front.
+        prop_size = STATIC_PROP_STRUCTS[game_lump.version].size
+        buf = bytearray(
+            4 + ST_MODEL_NAME.size * len(model_list)
+            + 4 + 2 * len(leaf_array)
+            + 4 + prop_size * len(props)
+        )
+
         # Now write out the sections.
-        prop_lump = BytesIO()
-        prop_lump.write(struct.pack('<i', len(model_list)))
+        ST_INT.pack_into(buf, 0, len(model_list))
+        off = 4
         for name in model_list:
-            prop_lump.write(struct.pack('<128s', name.encode('ascii')))
-
-        prop_lump.write(struct.pack('<i', len(leaf_array)))
-        prop_lump.write(struct.pack('<{}H'.format(len(leaf_array)), *leaf_array))
-
-        prop_lump.write(struct.pack('<i', len(props)))
+            ST_MODEL_NAME.pack_into(buf, off, name.encode('ascii'))
+            off += ST_MODEL_NAME.size
+
+        ST_INT.pack_into(buf, off, len(leaf_array))
+        off += 4
+        if sys.byteorder == 'big':
+            leaf_array.byteswap()
+        buf[off:off + 2 * len(leaf_array)] = leaf_array.tobytes()
+        off += 2 * len(leaf_array)
+
+        ST_INT.pack_into(buf, off, len(props))
+        off += 4
+        write_prop = STATIC_PROP_WRITERS[game_lump.version]
         for leaf_off, prop in zip(leaf_offsets, props):
-            prop_lump.write(struct.pack(
-                '<6fH',
-                prop.origin.x,
-                prop.origin.y,
-                prop.origin.z,
-                prop.angles.pitch,
-                prop.angles.yaw,
-                prop.angles.roll,
-                model_ind[prop.model],
-            ))
-
-            prop_lump.write(struct.pack(
-                '<HHBBifffff',
-                leaf_off,
-                len(prop.visleafs),
-                prop.solidity,
-                prop.flags.value_prim,
-                prop.skin,
-                prop.min_fade,
-                prop.max_fade,
-                prop.lighting.x,
-                prop.lighting.y,
-                prop.lighting.z,
-            ))
-            if game_lump.version >= 5:
-                prop_lump.write(struct.pack('<f', prop.fade_scale))
-
-            if game_lump.version in (6, 7):
-                prop_lump.write(struct.pack(
-                    '<HH',
-                    prop.min_dx_level,
-                    prop.max_dx_level,
-                ))
-
-            if game_lump.version >= 8:
-                prop_lump.write(struct.pack(
-                    '<BBBB',
-                    prop.min_cpu_level,
-                    prop.max_cpu_level,
-                    prop.min_gpu_level,
-                    prop.max_gpu_level
-                ))
-
-            if game_lump.version >= 7:
-                prop_lump.write(struct.pack(
-                    '<BBBB',
-                    int(prop.tint.x),
-                    int(prop.tint.y),
-                    int(prop.tint.z),
-                    prop.renderfx,
-                ))
-
-            if game_lump.version >= 10:
-                prop_lump.write(struct.pack('<I', prop.flags.value_sec))
-
-            if game_lump.version >= 11:
-                # Unknown padding/data, though it's always zero.
-
-                prop_lump.write(struct.pack('<xxxxf', prop.scaling))
-            elif game_lump.version >= 9:
-                # The 1-byte bool gets expanded to the full 4-byte size.
-                prop_lump.write(struct.pack('<?xxx', prop.disable_on_xbox))
+            write_prop(buf, off, prop, model_ind[prop.model], leaf_off)
+            off += prop_size
 
-        game_lump.data = prop_lump.getvalue()
+        game_lump.data = bytes(buf)
 
     def vis_tree(self) -> 'VisTree':
         """Parse the visleaf data to get the full node."""
         # First parse everything, then link up the objects.
-        planes: List[Tuple[Vec, float]] = []
+        # The plane lump also contains every brush plane, so only decode the
+        # ones the nodes actually use.
+        plane_data = self.lumps[BSP_LUMPS.PLANES].data
+        planes: Dict[int, Tuple[Vec, float]] = {}
         nodes: List[Tuple[VisTree, int, int]] = []
         leafs: List[VisLeaf] = []
 
-        for x, y, z, dist, flags in struct.iter_unpack('<ffffi', self.lumps[BSP_LUMPS.PLANES].data):
-            planes.append((Vec(x, y, z), dist))
-
         for (
-            plane_ind, neg_ind, pos_ind,
+            # The front child is first.
+            plane_ind, pos_ind, neg_ind,
             min_x, min_y, min_z,
             max_x, max_y, max_z,
             first_face, face_count, area_ind,
         ) in struct.iter_unpack('<iii6hHHh2x', self.lumps[BSP_LUMPS.NODES].data):
-            plane_norm, plane_dist = planes[plane_ind]
+            try:
+                plane_norm, plane_dist = planes[plane_ind]
+            except KeyError:
+                x, y, z, plane_dist, flags = PLANE_STRUCT.unpack_from(
+                    plane_data, plane_ind * PLANE_STRUCT.size,
+                )
+                plane_norm = Vec(x, y, z)
+                planes[plane_ind] = plane_norm, plane_dist
+            # The bounds are only converted to Vecs if accessed.
             nodes.append((VisTree(
                 plane_norm, plane_dist,
-                Vec(min_x, min_y, min_z),
-                Vec(max_x, max_y, max_z),
+                (min_x, min_y, min_z),
+                (max_x, max_y, max_z),
             ), neg_ind, pos_ind))
 
         leaf_fmt = '<ihh6h4Hh2x'
@@ -812,8 +976,8 @@ class BSP:
         ) in enumerate(struct.iter_unpack(leaf_fmt, self.lumps[BSP_LUMPS.LEAFS].data)):
             leafs.append(VisLeaf(
                 i, area_and_flags,
-                Vec(min_x, min_y, min_z),
-                Vec(max_x, max_y, max_z),
+                (min_x, min_y, min_z),
+                (max_x, max_y, max_z),
                 first_face, num_faces,
                 first_brush, num_brushes,
                 water_ind,
@@ -904,7 +1068,40 @@ class StaticProp:
     v9+ allows disabling on XBox 360.
     v10+ adds 4 unknown bytes (float?), and an expanded flags section.
     v11+ adds uniform scaling and removes XBox disabling.
+
+    The origin, angles, lighting origin and tint can also be passed as 3-tuples,
+    in which case the Vec or Angle is only constructed when first accessed.
     """
+    __slots__ = [
+        'model',
+        '_origin',
+        '_angles',
+        'scaling',
+        'visleafs',
+        'solidity',
+        'flags',
+        'skin',
+        'min_fade',
+        'max_fade',
+        '_lighting',
+        'fade_scale',
+        'min_dx_level',
+        'max_dx_level',
+        'min_cpu_level',
+        'max_cpu_level',
+        'min_gpu_level',
+        'max_gpu_level',
+        '_tint',
+        'renderfx',
+        'disable_on_xbox',
+    ]
+
+    # Either the tuple of values, or the Vec/Angle once accessed.
+    _origin: Union[Vec, Tuple[float, float, float]]
+    _angles: Union[Angle, Tuple[float, float, float]]
+    _lighting: Union[Vec, Tuple[float, float, float]]
+    _tint: Union[Vec, Tuple[float, float, float]]
+
     def __init__(
         self,
         model: str,
@@ -925,13 +1122,19 @@ class StaticProp:
         max_cpu_level: int=0,
         min_gpu_level: int=0,
         max_gpu_level: int=0,
-        tint: Vec=Vec(255, 255, 255),  # Rendercolor
+        tint: Union[Vec, Tuple[float, float, float]]=(255, 255, 255),  # Rendercolor
         renderfx: int=255,
         disable_on_xbox: bool=False,
     ) -> None:
         self.model = model
-        self.origin = origin
-        self.angles = angles
+        # Only 3-tuples are kept to convert later, anything else is converted
+        # now in the same way as Vec() and Angle() do.
+        if isinstance(origin, tuple) and len(origin) != 3:
+            origin = Vec(origin)
+        if isinstance(angles, tuple) and len(angles) != 3:
+            angles = Angle(angles)
+        self._origin = origin
+        self._angles = angles
         self.scaling = scaling
         self.visleafs = visleafs
         self.solidity = solidity
@@ -941,9 +1144,16 @@ class StaticProp:
         self.max_fade = max_fade
 
         if lighting_origin is None:
-            self.lighting = Vec(origin)
+            # Tuples are immutable, so they can be shared. A Vec still needs
+            # to be copied, otherwise editing the origin would move this too.
+            if isinstance(origin, tuple):
+                self._lighting = origin
+            else:
+                self._lighting = Vec(origin)
+        elif isinstance(lighting_origin, tuple) and len(lighting_origin) != 3:
+            self._lighting = Vec(lighting_origin)
         else:
-            self.lighting = lighting_origin
+            self._lighting = lighting_origin
 
         self.fade_scale = fade_scale
         self.min_dx_level = min_dx_level
@@ -952,10 +1162,66 @@ class StaticProp:
         self.max_cpu_level = max_cpu_level
         self.min_gpu_level = min_gpu_level
         self.max_gpu_level = max_gpu_level
-        self.tint = Vec(tint)
+        # Vecs passed in are used directly, without copying.
+        if isinstance(tint, Vec) or (isinstance(tint, tuple) and len(tint) == 3):
+            self._tint = tint
+        else:
+            self._tint = Vec(tint)
         self.renderfx = renderfx
         self.disable_on_xbox = disable_on_xbox
 
+    @property
+    def origin(self) -> Vec:
+        """The position of the prop."""
+        if isinstance(self._origin, tuple):
+            self._origin = Vec(*self._origin)
+        return self._origin
+
+    @origin.setter
+    def origin(self, value: Vec) -> None:
+        if isinstance(value, tuple) and len(value) != 3:
+            value = Vec(value)
+        self._origin = value
+
+    @property
+    def angles(self) -> Angle:
+        """The rotation of the prop."""
+        if isinstance(self._angles, tuple):
+            self._angles = Angle(*self._angles)
+        return self._angles
+
+    @angles.setter
+    def angles(self, value: Angle) -> None:
+        if isinstance(value, tuple) and len(value) != 3:
+            value = Angle(value)
+        self._angles = value
+
+    @property
+    def lighting(self) -> Vec:
+        """The position used to compute lighting for the prop."""
+        if isinstance(self._lighting, tuple):
+            self._lighting = Vec(*self._lighting)
+        return self._lighting
+
+    @lighting.setter
+    def lighting(self, value: Vec) -> None:
+        if isinstance(value, tuple) and len(value) != 3:
+            value = Vec(value)
+        self._lighting = value
+
+    @property
+    def tint(self) -> Vec:
+        """The colour to tint the prop by."""
+        if isinstance(self._tint, tuple):
+            self._tint = Vec(*self._tint)
+        return self._tint
+
+    @tint.setter
+    def tint(self, value: Vec) -> None:
+        if isinstance(value, tuple) and len(value) != 3:
+            value = Vec(value)
+        self._tint = value
+
     def __repr__(self) -> str:
         return '<Prop "{}#{}" @ {} rot {}>'.format(
             self.model,
@@ -964,16 +1230,35 @@ class StaticProp:
             self.angles,
         )
 
+
 class VisLeaf:
     """A leaf in the visleaf data.
 
     The bounds is defined implicitly by the parent node planes.
     """
+    __slots__ = [
+        'id',
+        'area',
+        'flags',
+        '_mins',
+        '_maxes',
+        'first_face',
+        'face_count',
+        'first_brush',
+        'brush_count',
+        'water_id',
+    ]
+
+    # Either the tuple of values, or the Vec once accessed.
+    _mins: Union[Vec, Tuple[float, float, float]]
+    _maxes: Union[Vec, Tuple[float, float, float]]
+
     def __init__(
         self,
         leaf_id: int,
         area_and_flags: int,
-        mins: Vec, maxes: Vec,
+        mins: Union[Vec, Tuple[float, float, float]],
+        maxes: Union[Vec, Tuple[float, float, float]],
         first_face: int,
         face_count: int,
         first_brush: int,
@@ -983,14 +1268,36 @@ class VisLeaf:
         self.id = leaf_id
         self.area =  area_and_flags & 0b1111111110000000
         self.flags = area_and_flags & 0b0000000001111111
-        self.mins = mins
-        self.maxes = maxes
+        self._mins = mins
+        self._maxes = maxes
         self.first_face = first_face
         self.face_count = face_count
         self.first_brush = first_brush
         self.brush_count = brush_count
         self.water_id = water_id
 
+    @property
+    def mins(self) -> Vec:
+        """The minimum corner of the bounding box."""
+        if isinstance(self._mins, tuple):
+            self._mins = Vec(*self._mins)
+        return self._mins
+
+    @mins.setter
+    def mins(self, value: Vec) -> None:
+        self._mins = value
+
+    @property
+    def maxes(self) -> Vec:
+        """The maximum corner of the bounding box."""
+        if isinstance(self._maxes, tuple):
+            self._maxes = Vec(*self._maxes)
+        return self._maxes
+
+    @maxes.setter
+    def maxes(self, value: Vec) -> None:
+        self._maxes = value
+
 
 class VisTree:
     """A tree node in the visleaf data.
@@ -998,20 +1305,68 @@ class VisTree:
     Each of these is a plane splitting the map in two, which then has a child
     tree or visleaf on either side.
     """
+    __slots__ = [
+        'plane_norm',
+        'plane_dist',
+        '_mins',
+        '_maxes',
+        'child_neg',
+        'child_pos',
+    ]
+
     plane_norm: Vec
     plane_dist: float
+    _mins: Union[Vec, Tuple[float, float, float]]
+    _maxes: Union[Vec, Tuple[float, float, float]]
     child_neg: Union['VisTree', VisLeaf]
     child_pos: Union['VisTree', VisLeaf]
 
     def __init__(
         self,
         norm: Vec, dist: float,
-        mins: Vec, maxes: Vec,
+        mins: Union[Vec, Tuple[float, float, float]],
+        maxes: Union[Vec, Tuple[float, float, float]],
     ) -> None:
         self.plane_norm = norm
         self.plane_dist = dist
-        self.mins = mins
-        self.maxes = maxes
+        self._mins = mins
+        self._maxes = maxes
         # Replaced after.
         self.child_neg = None  # type: ignore
         self.child_pos = None  # type: ignore
+
+    @property
+    def mins(self) -> Vec:
+        """The minimum corner of the bounding box."""
+        if isinstance(self._mins, tuple):
+            self._mins = Vec(*self._mins)
+        return self._mins
+
+    @mins.setter
+    def mins(self, value: Vec) -> None:
+        self._mins = value
+
+    @property
+    def maxes(self) -> Vec:
+        """The maximum corner of the bounding box."""
+        if isinstance(self._maxes, tuple):
+            self._maxes = Vec(*self._maxes)
+        return self._maxes
+
+    @maxes.setter
+    def maxes(self, value: Vec) -> None:
+        self._maxes = value
+
+    def test_point(self, point: Vec) -> VisLeaf:
+        """Find the leaf containing the given point.
+
+        Points lying exactly on a plane are treated as in front of it, like the
+        engine does.
+        """
+        node: Union[VisTree, VisLeaf] = self
+        while isinstance(node, VisTree):
+            if node.plane_norm.dot(point) - node.plane_dist < 0:
+                node = node.child_neg
+            else:
+                node = node.child_pos
+        return node
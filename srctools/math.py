@@ -37,11 +37,12 @@ Rotates LHS by RHS:
 """
 import math
 import contextlib
+import itertools
 import warnings
 
 from typing import (
     Union, Tuple, overload, Type,
-    Dict, NamedTuple,
+    Dict, NamedTuple, Optional, Callable, Any,
     Iterator, Iterable,
 )
 
@@ -126,6 +127,18 @@ class Vec_tuple(NamedTuple):
     z: float
 
 
+def _raw_vec(x: float, y: float, z: float) -> 'Vec':
+    """Construct a Py_Vec from values which are already floats.
+
+    This skips the checks and conversions in __init__, for the operators.
+    """
+    vec = object.__new__(Py_Vec)
+    vec.x = x
+    vec.y = y
+    vec.z = z
+    return vec
+
+
 # Use template code to reduce duplication in the various magic number methods.
 
 _VEC_ADDSUB_TEMP = '''
@@ -135,7 +148,7 @@ def __{func}__(self, other: Union['Vec', tuple, float]):
     This additionally works on scalars (adds to all axes).
     """
     if isinstance(other, Py_Vec):
-        return Py_Vec(
+        return _raw_vec(
             self.x {op} other.x,
             self.y {op} other.y,
             self.z {op} other.z,
@@ -152,7 +165,7 @@ def __{func}__(self, other: Union['Vec', tuple, float]):
     except TypeError:
         return NotImplemented
     else:
-        return Py_Vec(x, y, z)
+        return _raw_vec(x, y, z)
 
 def __r{func}__(self, other: Union['Vec', tuple, float]):
     """{op} operation with reversed operands.
@@ -160,7 +173,7 @@ def __r{func}__(self, other: Union['Vec', tuple, float]):
     This additionally works on scalars (adds to all axes).
     """
     if isinstance(other, Py_Vec):
-        return Py_Vec(
+        return _raw_vec(
             other.x {op} self.x,
             other.y {op} self.y,
             other.z {op} self.z,
@@ -177,7 +190,7 @@ def __r{func}__(self, other: Union['Vec', tuple, float]):
     except TypeError:
         return NotImplemented
     else:
-        return Py_Vec(x, y, z)
+        return _raw_vec(x, y, z)
 
 def __i{func}__(self, other: Union['Vec', tuple, float]):
     """{op}= operation.
@@ -212,7 +225,7 @@ def __{func}__(self, other: float):
         raise TypeError("Cannot {pretty} 2 Vectors.")
     else:
         try:
-            return Py_Vec(
+            return _raw_vec(
                 self.x {op} other,
                 self.y {op} other,
                 self.z {op} other,
@@ -226,7 +239,7 @@ def __r{func}__(self, other: float):
         raise TypeError("Cannot {pretty} 2 Vectors.")
     else:
         try:
-            return Py_Vec(
+            return _raw_vec(
                 other {op} self.x,
                 other {op} self.y,
                 other {op} self.z,
@@ -249,6 +262,37 @@ def __i{func}__(self, other: float):
         return self
 '''
 
+# Vec.with_axes() specialised for each combination of axis names.
+_VEC_WITH_AXES_TEMP = '''
+def with_axes(cls, val1, val2, val3):
+    vec = cls.__new__(cls){assigns}
+    return vec
+'''
+_VEC_WITH_AXES = {}  # type: Dict[Tuple[str, Optional[str], Optional[str]], Callable[..., Vec]]
+
+
+def _gen_vec_with_axes() -> None:
+    """Generate the specialised versions of Vec.with_axes()."""
+    for count in (1, 2, 3):
+        for axes in itertools.permutations('xyz', count):
+            namespace = {}  # type: Dict[str, Any]
+            assigns = [
+                '\n    vec.{ax} = float(val{i}.{ax} if isinstance(val{i}, Py_Vec) else val{i})'.format(
+                    ax=axis, i=i,
+                ) for i, axis in enumerate(axes, 1)
+            ]
+            # The remaining axes are zero, like the constructor.
+            assigns += [
+                '\n    vec.{} = 0.0'.format(axis)
+                for axis in 'xyz' if axis not in axes
+            ]
+            exec(_VEC_WITH_AXES_TEMP.format(assigns=''.join(assigns)), globals(), namespace)
+            key = (axes + (None, None))[:3]
+            _VEC_WITH_AXES[key] = namespace['with_axes']
+
+
+_gen_vec_with_axes()
+
 
 class Vec:
     """A 3D Vector. This has most standard Vector functions.
@@ -300,6 +344,11 @@ class Vec:
             self.x = x.x
             self.y = x.y
             self.z = x.z
+        elif isinstance(x, tuple) and len(x) == 3:
+            # Fast path for the most common iterable, and Vec_tuple.
+            self.x = float(x[0])
+            self.y = float(x[1])
+            self.z = float(x[2])
         else:
             it = iter(x)
             self.x = float(next(it, 0.0))
@@ -308,7 +357,7 @@ class Vec:
 
     def copy(self) -> 'Vec':
         """Create a duplicate of this vector."""
-        return Py_Vec(self.x, self.y, self.z)
+        return _raw_vec(self.x, self.y, self.z)
 
     __copy__ = copy  # copy module support.
 
@@ -375,6 +424,16 @@ class Vec:
         The magnitudes can also be Vectors, in which case the matching
         axis will be used from the vector.
         """
+        if axis2 is None:
+            axis3 = None  # Ignored if axis2 isn't passed.
+        try:
+            func = _VEC_WITH_AXES[axis1, axis2, axis3]
+        except (KeyError, TypeError):
+            # Repeated or invalid axes, or indexes - do it the slow way.
+            pass
+        else:
+            return func(cls, val1, val2, val3)
+
         vec = cls()
         vec[axis1] = val1[axis1] if isinstance(val1, Py_Vec) else val1
         if axis2 is not None:
@@ -453,11 +512,30 @@ class Vec:
                 ) from None
 
         bbox_min = Py_Vec(first)
-        bbox_max = bbox_min.copy()
+        # Track the bounds in locals, instead of calling min()/max() each time.
+        min_x = max_x = bbox_min.x
+        min_y = max_y = bbox_min.y
+        min_z = max_z = bbox_min.z
         for point in point_coll:
-            bbox_min.min(point)
-            bbox_max.max(point)
-        return bbox_min, bbox_max
+            if isinstance(point, Py_Vec):
+                x, y, z = point.x, point.y, point.z
+            else:
+                x, y, z = point[0], point[1], point[2]
+            # If it's below the minimum, it can't be above the maximum.
+            if x < min_x:
+                min_x = x
+            elif x > max_x:
+                max_x = x
+            if y < min_y:
+                min_y = y
+            elif y > max_y:
+                max_y = y
+            if z < min_z:
+                min_z = z
+            elif z > max_z:
+                max_z = z
+        bbox_min.x, bbox_min.y, bbox_min.z = min_x, min_y, min_z
+        return bbox_min, Py_Vec(max_x, max_y, max_z)
 
     @classmethod
     def iter_grid(
@@ -500,8 +578,10 @@ class Vec:
             return
 
         direction = offset.norm()
+        x, y, z = self.x, self.y, self.z
+        dir_x, dir_y, dir_z = direction.x, direction.y, direction.z
         for pos in range(0, int(length), int(stride)):
-            yield self + direction * pos
+            yield _raw_vec(x + dir_x * pos, y + dir_y * pos, z + dir_z * pos)
         yield end.copy()  # Directly yield - ensures no rounding errors.
 
     def axis(self) -> str:
@@ -561,7 +641,7 @@ class Vec:
 
     def __abs__(self) -> 'Vec':
         """Performing abs() on a Vec takes the absolute value of all axes."""
-        return Py_Vec(
+        return _raw_vec(
             abs(self.x),
             abs(self.y),
             abs(self.z),
@@ -634,7 +714,7 @@ class Vec:
             except TypeError:
                 return NotImplemented
             else:
-                return Py_Vec(x1, y1, z1), Py_Vec(x2, y2, z2)
+                return _raw_vec(x1, y1, z1), _raw_vec(x2, y2, z2)
 
     def __rdivmod__(self, other: float) -> Tuple['Vec', 'Vec']:
         """Divide a scalar by a vector, returning the result and remainder."""
@@ -645,7 +725,7 @@ class Vec:
         except (TypeError, ValueError):
             return NotImplemented
         else:
-            return Py_Vec(x1, y1, z1), Py_Vec(x2, y2, z2)
+            return _raw_vec(x1, y1, z1), _raw_vec(x2, y2, z2)
 
     def __matmul__(self, other: Union['Angle', 'Matrix']) -> 'Vec':
         """Rotate this vector by an angle or matrix."""
@@ -655,9 +735,7 @@ class Vec:
             mat = Py_Matrix.from_angle(other)
         else:
             return NotImplemented
-        res = Vec(self.x, self.y, self.z)
-        mat._vec_rot(res)
-        return res
+        return _raw_vec(*mat._rotate_xyz(self.x, self.y, self.z))
 
     def __imatmul__(self, other: Union['Angle', 'Matrix']) -> 'Vec':
         """We need to define this, so it's in-place."""
@@ -808,25 +886,35 @@ class Vec:
 
     def max(self, other: AnyVec) -> None:
         """Set this vector's values to the maximum of the two vectors."""
-        if self.x < other[0]:
-            self.x = other[0]
-        if self.y < other[1]:
-            self.y = other[1]
-        if self.z < other[2]:
-            self.z = other[2]
+        # Fetch each value once, indexing a Vec is fairly slow.
+        if isinstance(other, Py_Vec):
+            x, y, z = other.x, other.y, other.z
+        else:
+            x, y, z = other[0], other[1], other[2]
+        if self.x < x:
+            self.x = x
+        if self.y < y:
+            self.y = y
+        if self.z < z:
+            self.z = z
 
     def min(self, other: AnyVec) -> None:
         """Set this vector's values to be the minimum of the two vectors."""
-        if self.x > other[0]:
-            self.x = other[0]
-        if self.y > other[1]:
-            self.y = other[1]
-        if self.z > other[2]:
-            self.z = other[2]
+        # Fetch each value once, indexing a Vec is fairly slow.
+        if isinstance(other, Py_Vec):
+            x, y, z = other.x, other.y, other.z
+        else:
+            x, y, z = other[0], other[1], other[2]
+        if self.x > x:
+            self.x = x
+        if self.y > y:
+            self.y = y
+        if self.z > z:
+            self.z = z
 
     def __round__(self, n: int=0) -> 'Vec':
         """Performing round() on a Py_Vec rounds each axis."""
-        return Py_Vec(
+        return _raw_vec(
             round(self.x, n),
             round(self.y, n),
             round(self.z, n),
@@ -924,11 +1012,11 @@ class Vec:
 
     def __neg__(self) -> 'Vec':
         """The inverted form of a Vector has inverted axes."""
-        return Py_Vec(-self.x, -self.y, -self.z)
+        return _raw_vec(-self.x, -self.y, -self.z)
 
     def __pos__(self) -> 'Vec':
         """+ on a Vector simply copies it."""
-        return Py_Vec(self.x, self.y, self.z)
+        return _raw_vec(self.x, self.y, self.z)
 
     def norm(self) -> 'Vec':
         """Normalise the Vector.
@@ -937,15 +1025,17 @@ class Vec:
          direction.
          The vector is left unchanged if it is equal to (0,0,0)
          """
-        if self.x == 0 and self.y == 0 and self.z == 0:
+        x = self.x
+        y = self.y
+        z = self.z
+        if x == 0 and y == 0 and z == 0:
             # Don't do anything for this - otherwise we'd get division
             # by zero errors - we want this to be a valid normal!
             return self.copy()
         else:
+            mag = math.sqrt(x**2 + y**2 + z**2)
             # Adding 0 clears -0 values - we don't want those.
-            val = self / self.mag()
-            val += 0
-            return val
+            return _raw_vec(x / mag + 0, y / mag + 0, z / mag + 0)
 
     def dot(self, other: AnyVec) -> float:
         """Return the dot product of both Vectors."""
@@ -957,7 +1047,7 @@ class Vec:
 
     def cross(self, other: AnyVec) -> 'Vec':
         """Return the cross product of both Vectors."""
-        return Py_Vec(
+        return _raw_vec(
             self.y * other[2] - self.z * other[1],
             self.z * other[0] - self.x * other[2],
             self.x * other[1] - self.y * other[0],
@@ -1006,6 +1096,9 @@ _IND_TO_SLOT = {
     for x in (0, 1, 2)
     for y in (0, 1, 2)
 }
+# Bound once, so constructing a matrix skips looking up __new__ on the class.
+_new_matrix = object.__new__
+_MATRIX_REPR = '<Matrix {:.3} {:.3} {:.3}, {:.3} {:.3} {:.3}, {:.3} {:.3} {:.3}>'
 
 
 class Matrix:
@@ -1032,17 +1125,15 @@ class Matrix:
         return NotImplemented
         
     def __repr__(self) -> str:
-        return (
-            '<Matrix '
-            f'{self._aa:.3} {self._ab:.3} {self._ac:.3}, '
-            f'{self._ba:.3} {self._bb:.3} {self._bc:.3}, '
-            f'{self._ca:.3} {self._cb:.3} {self._cc:.3}'
-            '>'
+        return _MATRIX_REPR.format(
+            self._aa, self._ab, self._ac,
+            self._ba, self._bb, self._bc,
+            self._ca, self._cb, self._cc,
         )
 
     def copy(self) -> 'Matrix':
         """Duplicate this matrix."""
-        rot = Py_Matrix.__new__(Py_Matrix)
+        rot = _new_matrix(Py_Matrix)
 
         rot._aa, rot._ab, rot._ac = self._aa, self._ab, self._ac
         rot._ba, rot._bb, rot._bc = self._ba, self._bb, self._bc
@@ -1072,7 +1163,7 @@ class Matrix:
         cos = math.cos(rad_pitch)
         sin = math.sin(rad_pitch)
 
-        rot: Matrix = cls.__new__(cls)
+        rot: Matrix = _new_matrix(cls)
 
         rot._aa, rot._ab, rot._ac = cos, 0.0, -sin
         rot._ba, rot._bb, rot._bc = 0.0, 1.0, 0.0
@@ -1089,7 +1180,7 @@ class Matrix:
         sin = math.sin(rad_yaw)
         cos = math.cos(rad_yaw)
 
-        rot: Matrix = cls.__new__(cls)
+        rot: Matrix = _new_matrix(cls)
 
         rot._aa, rot._ab, rot._ac = cos, sin, 0.0
         rot._ba, rot._bb, rot._bc = -sin, cos, 0.0
@@ -1107,7 +1198,7 @@ class Matrix:
         cos_r = math.cos(rad_roll)
         sin_r = math.sin(rad_roll)
 
-        rot: Matrix = cls.__new__(cls)
+        rot: Matrix = _new_matrix(cls)
 
         rot._aa, rot._ab, rot._ac = 1.0, 0.0, 0.0
         rot._ba, rot._bb, rot._bc = 0.0, cos_r, sin_r
@@ -1128,7 +1219,7 @@ class Matrix:
         cos_r = math.cos(rad_roll)
         sin_r = math.sin(rad_roll)
 
-        rot = Py_Matrix.__new__(Py_Matrix)
+        rot = _new_matrix(Py_Matrix)
 
         rot._aa = cos_p * cos_y
         rot._ab = cos_p * sin_y
@@ -1158,7 +1249,7 @@ class Matrix:
         icos = 1 - cos
         sin = math.sin(angle_rad)
 
-        mat = Py_Matrix.__new__(Py_Matrix)
+        mat = _new_matrix(Py_Matrix)
 
         mat._aa = x*x * icos + cos
         mat._ab = x*y * icos - z*sin
@@ -1225,7 +1316,7 @@ class Matrix:
 
     def transpose(self) -> 'Matrix':
         """Return the transpose of this matrix."""
-        rot = Py_Matrix.__new__(Py_Matrix)
+        rot = _new_matrix(Py_Matrix)
 
         rot._aa, rot._ab, rot._ac = self._aa, self._ba, self._ca
         rot._ba, rot._bb, rot._bc = self._ab, self._bb, self._cb
@@ -1235,26 +1326,29 @@ class Matrix:
 
     @classmethod
     @overload
-    def from_basis(cls, *, x: Vec, y: Vec, z: Vec) -> 'Matrix': ...
+    def from_basis(cls, *, x: Vec, y: Vec, z: Vec, normalise: bool=True) -> 'Matrix': ...
     @classmethod
     @overload
-    def from_basis(cls, *, x: Vec, y: Vec) -> 'Matrix': ...
+    def from_basis(cls, *, x: Vec, y: Vec, normalise: bool=True) -> 'Matrix': ...
     @classmethod
     @overload
-    def from_basis(cls, *, y: Vec, z: Vec) -> 'Matrix': ...
+    def from_basis(cls, *, y: Vec, z: Vec, normalise: bool=True) -> 'Matrix': ...
     @classmethod
     @overload
-    def from_basis(cls, *, x: Vec, z: Vec) -> 'Matrix': ...
+    def from_basis(cls, *, x: Vec, z: Vec, normalise: bool=True) -> 'Matrix': ...
     @classmethod
     def from_basis(
         cls, *,
         x: Vec=None,
         y: Vec=None,
         z: Vec=None,
+        normalise: bool=True,
     ) -> 'Matrix':
         """Construct a matrix from at least two basis vectors.
 
-        The third is computed, if not provided.
+        The third is computed, if not provided. If normalise is False, the
+        vectors are used as-is - they must already be unit length, or the
+        matrix will not be a valid rotation.
         """
         if x is None and y is not None and z is not None:
             x = Vec.cross(y, z)
@@ -1264,10 +1358,15 @@ class Matrix:
             z = Vec.cross(x, y)
         if x is None or y is None or z is None:
             raise TypeError('At least two vectors must be provided!')
-        mat: Matrix = cls.__new__(cls)
-        mat._aa, mat._ab, mat._ac = x.norm()
-        mat._ba, mat._bb, mat._bc = y.norm()
-        mat._ca, mat._cb, mat._cc = z.norm()
+        mat: Matrix = _new_matrix(cls)
+        if normalise:
+            mat._aa, mat._ab, mat._ac = x.norm()
+            mat._ba, mat._bb, mat._bc = y.norm()
+            mat._ca, mat._cb, mat._cc = z.norm()
+        else:
+            mat._aa, mat._ab, mat._ac = x.x, x.y, x.z
+            mat._ba, mat._bb, mat._bc = y.x, y.y, y.z
+            mat._ca, mat._cb, mat._cc = z.x, z.y, z.z
         return mat
 
     @overload
@@ -1276,16 +1375,21 @@ class Matrix:
     def __matmul__(self, other: 'Angle') -> 'Matrix': ...
 
     def __matmul__(self, other: object) -> 'Matrix':
-        if isinstance(other, Py_Matrix):
-            mat = self.copy()
-            mat._mat_mul(other)
-            return mat
-        elif isinstance(other, Py_Angle):
-            mat = self.copy()
-            mat._mat_mul(Py_Matrix.from_angle(other))
-            return mat
+        # A failed isinstance() walks the MRO, so check the exact types first.
+        cls = type(other)
+        if cls is not Py_Matrix and cls is not Py_Angle:
+            if isinstance(other, Py_Matrix):
+                cls = Py_Matrix
+            elif isinstance(other, Py_Angle):
+                cls = Py_Angle
+            else:
+                return NotImplemented
+        mat = _new_matrix(Py_Matrix)
+        if cls is Py_Matrix:
+            self._mat_mul_into(other, mat)
         else:
-            return NotImplemented
+            self._mat_mul_into(Py_Matrix.from_angle(other), mat)
+        return mat
 
     @overload
     def __rmatmul__(self, other: Vec) -> Vec: ...
@@ -1295,19 +1399,26 @@ class Matrix:
     def __rmatmul__(self, other: 'Angle') -> 'Angle': ...
     
     def __rmatmul__(self, other):
-        if isinstance(other, Py_Vec):
-            result = other.copy()
-            self._vec_rot(result)
-            return result
-        elif isinstance(other, Py_Angle):
+        cls = type(other)
+        if cls is not Py_Vec and cls is not Py_Angle and cls is not Py_Matrix:
+            if isinstance(other, Py_Vec):
+                cls = Py_Vec
+            elif isinstance(other, Py_Angle):
+                cls = Py_Angle
+            elif isinstance(other, Py_Matrix):
+                cls = Py_Matrix
+            else:
+                return NotImplemented
+        if cls is Py_Vec:
+            return _raw_vec(*self._rotate_xyz(other.x, other.y, other.z))
+        elif cls is Py_Angle:
             mat = Py_Matrix.from_angle(other)
             mat._mat_mul(self)
             return mat.to_angle()
-        elif isinstance(other, Py_Matrix):
-            mat = other.copy()
-            return mat._mat_mul(self)
         else:
-            return NotImplemented
+            mat = _new_matrix(Py_Matrix)
+            other._mat_mul_into(self, mat)
+            return mat
 
     @overload
     def __imatmul__(self, other: 'Matrix') -> 'Matrix': ...
@@ -1315,32 +1426,44 @@ class Matrix:
     def __imatmul__(self, other: 'Angle') -> 'Matrix': ...
 
     def __imatmul__(self, other):
-        if isinstance(other, Py_Matrix):
+        cls = type(other)
+        if cls is not Py_Matrix and cls is not Py_Angle:
+            if isinstance(other, Py_Matrix):
+                cls = Py_Matrix
+            elif isinstance(other, Py_Angle):
+                cls = Py_Angle
+            else:
+                return NotImplemented
+        if cls is Py_Matrix:
             self._mat_mul(other)
-            return self
-        elif isinstance(other, Py_Angle):
-            self._mat_mul(Py_Matrix.from_angle(other))
-            return self
         else:
-            return NotImplemented
+            self._mat_mul(Py_Matrix.from_angle(other))
+        return self
             
     def _mat_mul(self, other: 'Matrix') -> None:
         """Rotate myself by the other matrix."""
+        self._mat_mul_into(other, self)
+
+    def _mat_mul_into(self, other: 'Matrix', out: 'Matrix') -> None:
+        """Store the result of rotating myself by the other matrix into out.
+
+        Out may be this matrix, but not the other.
+        """
         # We don't use each row after assigning to the set, so we can re-assign.
         # 3-tuple unpacking is optimised.
-        self._aa, self._ab, self._ac = (
+        out._aa, out._ab, out._ac = (
             self._aa * other._aa + self._ab * other._ba + self._ac * other._ca,
             self._aa * other._ab + self._ab * other._bb + self._ac * other._cb,
             self._aa * other._ac + self._ab * other._bc + self._ac * other._cc,
         )
 
-        self._ba, self._bb, self._bc = (
+        out._ba, out._bb, out._bc = (
             self._ba * other._aa + self._bb * other._ba + self._bc * other._ca,
             self._ba * other._ab + self._bb * other._bb + self._bc * other._cb,
             self._ba * other._ac + self._bb * other._bc + self._bc * other._cc,
         )
 
-        self._ca, self._cb, self._cc = (
+        out._ca, out._cb, out._cc = (
             self._ca * other._aa + self._cb * other._ba + self._cc * other._ca,
             self._ca * other._ab + self._cb * other._bb + self._cc * other._cb,
             self._ca * other._ac + self._cb * other._bc + self._cc * other._cc,
@@ -1348,14 +1471,25 @@ class Matrix:
     
     def _vec_rot(self, vec: Vec) -> None:
         """Rotate a vector by our value."""
-        x = vec.x
-        y = vec.y
-        z = vec.z
-        vec.x = (x * self._aa) + (y * self._ba) + (z * self._ca)
-        vec.y = (x * self._ab) + (y * self._bb) + (z * self._cb)
-        vec.z = (x * self._ac) + (y * self._bc) + (z * self._cc)
+        vec.x, vec.y, vec.z = self._rotate_xyz(vec.x, vec.y, vec.z)
+
+    def _rotate_xyz(self, x: float, y: float, z: float) -> Tuple3:
+        """Return the result of rotating the given coordinates by our value."""
+        return (
+            (x * self._aa) + (y * self._ba) + (z * self._ca),
+            (x * self._ab) + (y * self._bb) + (z * self._cb),
+            (x * self._ac) + (y * self._bc) + (z * self._cc),
+        )
 
     
+# The attribute for each index or axis name, for Angle.__getitem__/__setitem__.
+_ANGLE_AXES = {
+    0: '_pitch', 'p': '_pitch', 'pit': '_pitch', 'pitch': '_pitch',
+    1: '_yaw', 'y': '_yaw', 'yaw': '_yaw',
+    2: '_roll', 'r': '_roll', 'rol': '_roll', 'roll': '_roll',
+}
+
+
 class Angle:
     """Represents a pitch-yaw-roll Euler angle.
 
@@ -1557,13 +1691,10 @@ class Angle:
         - p, y, r
         Useful in conjunction with a loop to apply commands to all values.
         """
-        if ind in (0, 'p', 'pit', 'pitch'):
-            return self._pitch
-        elif ind in (1, 'y', 'yaw'):
-            return self._yaw
-        elif ind in (2, 'r', 'rol', 'roll'):
-            return self._roll
-        raise KeyError('Invalid axis: {!r}'.format(ind))
+        try:
+            return getattr(self, _ANGLE_AXES[ind])
+        except (KeyError, TypeError):  # TypeError for unhashable values.
+            raise KeyError('Invalid axis: {!r}'.format(ind)) from None
 
     def __setitem__(self, ind: Union[str, int], val: float) -> None:
         """Allow editing values by index instead of name if desired.
@@ -1571,14 +1702,11 @@ class Angle:
         This accepts either 0,1,2 or 'x','y','z' to edit values.
         Useful in conjunction with a loop to apply commands to all values.
         """
-        if ind in (0, 'p', 'pit', 'pitch'):
-            self._pitch = float(val) % 360.0 % 360.0
-        elif ind in (1, 'y', 'yaw'):
-            self._yaw = float(val) % 360.0 % 360.0
-        elif ind in (2, 'r', 'rol', 'roll'):
-            self._roll = float(val) % 360.0 % 360.0
-        else:
-            raise KeyError('Invalid axis: {!r}'.format(ind))
+        try:
+            axis = _ANGLE_AXES[ind]
+        except (KeyError, TypeError):  # TypeError for unhashable values.
+            raise KeyError('Invalid axis: {!r}'.format(ind)) from None
+        setattr(self, axis, float(val) % 360.0 % 360.0)
 
     def __eq__(self, other: object) -> bool:
         """== test.
@@ -1666,9 +1794,10 @@ class Angle:
 
     def __rmatmul__(self, other):
         """Vec @ Angle rotates the first by the second."""
-        if isinstance(other, Py_Vec):
+        cls = type(other)
+        if cls is Py_Vec or (cls is not Py_Angle and isinstance(other, Py_Vec)):
             return other @ Py_Matrix.from_angle(self)
-        elif isinstance(other, Py_Angle):
+        elif cls is Py_Angle or isinstance(other, Py_Angle):
             # Should always be done by __mul__!
             return self._rotate_angle(other)
         return NotImplemented
@@ -0,0 +1,232 @@
+"""Test the BSP parser."""
+import pytest
+
+from srctools.bsp import BSP, BSP_LUMPS, StaticProp, StaticPropFlags
+from srctools.math import Vec, Angle
+from srctools.vmf import VMF
+import srctools.test
+
+try:
+    from importlib.resources import path as import_file_path
+except ImportError:
+    from importlib_resources import path as import_file_path
+
+
+def test_vis_tree_point() -> None:
+    """Check VisTree.test_point() finds the leaf containing each entity."""
+    with import_file_path(srctools.test, 'rot_main.bsp') as bsp_path:
+        bsp = BSP(bsp_path)
+    tree = bsp.vis_tree()
+    vmf = bsp.read_ent_data()
+
+    for ent in vmf.entities:
+        origin = Vec.from_str(ent['origin'])
+        leaf = tree.test_point(origin)
+        # The bounds are rounded to integers.
+        for axis in 'xyz':
+            assert leaf.mins[axis] - 1 <= origin[axis] <= leaf.maxes[axis] + 1, ent
+
+
+@pytest.mark.parametrize('version', range(4, 12))
+def test_static_prop_roundtrip(version: int) -> None:
+    """Check static props survive writing and reading back in each lump version."""
+    with import_file_path(srctools.test, 'rot_main.bsp') as bsp_path:
+        bsp = BSP(bsp_path)
+    bsp.game_lumps[b'sprp'].version = version
+
+    # Only set values each version can store, the rest are the defaults.
+    props = [
+        StaticProp(
+            'models/props/crate.mdl',
+            Vec(128, -64.5, 32),
+            Angle(15, 270, 5),
+            2.5 if version >= 11 else 1.0,
+            [3, 4, 5],
+            6,
+            StaticPropFlags.DOES_FADE | StaticPropFlags.NO_SHADOW | (
+                StaticPropFlags.NO_FLASHLIGHT | StaticPropFlags.BOUNCED_LIGHTING
+                if version >= 10 else StaticPropFlags.NONE
+            ),
+            skin=2,
+            min_fade=512.0,
+            max_fade=1024.0,
+            lighting_origin=Vec(120, -60, 40),
+            fade_scale=0.5 if version >= 5 else 1,
+            min_dx_level=80 if version in (6, 7) else 0,
+            max_dx_level=95 if version in (6, 7) else 0,
+            min_cpu_level=1 if version >= 8 else 0,
+            max_cpu_level=2 if version >= 8 else 0,
+            min_gpu_level=1 if version >= 8 else 0,
+            max_gpu_level=3 if version >= 8 else 0,
+            tint=Vec(255, 128, 0) if version >= 7 else Vec(255, 255, 255),
+            renderfx=3 if version >= 7 else 255,
+            disable_on_xbox=version in (9, 10),
+        ),
+        StaticProp(
+            'models/props/barrel.mdl',
+            Vec(0, 0, 0),
+            Angle(0, 90, 0),
+            1.0,
+            [5],
+            0,
+        ),
+    ]
+    bsp.write_static_props(props)
+    read = list(bsp.static_props())
+    assert len(read) == len(props)
+    for orig, prop in zip(props, read):
+        assert prop.model == orig.model
+        assert prop.origin == orig.origin
+        assert prop.angles == orig.angles
+        assert prop.scaling == orig.scaling
+        assert prop.visleafs == orig.visleafs
+        assert prop.solidity == orig.solidity
+        assert prop.flags == orig.flags
+        assert prop.skin == orig.skin
+        assert prop.min_fade == orig.min_fade
+        assert prop.max_fade == orig.max_fade
+        assert prop.lighting == orig.lighting
+        if version >= 5:
+            assert prop.fade_scale == orig.fade_scale
+        else:  # Not stored, so it's the default.
+            assert prop.fade_scale == 1
+        assert prop.min_dx_level == orig.min_dx_level
+        assert prop.max_dx_level == orig.max_dx_level
+        assert prop.min_cpu_level == orig.min_cpu_level
+        assert prop.max_cpu_level == orig.max_cpu_level
+        assert prop.min_gpu_level == orig.min_gpu_level
+        assert prop.max_gpu_level == orig.max_gpu_level
+        assert prop.tint == orig.tint
+        assert prop.renderfx == orig.renderfx
+        assert prop.disable_on_xbox == orig.disable_on_xbox
+
+
+def _read_ents(data: bytes) -> VMF:
+    """Parse the given entity lump."""
+    with import_file_path(srctools.test, 'rot_main.bsp') as bsp_path:
+        bsp = BSP(bsp_path)
+    bsp.lumps[BSP_LUMPS.ENTITIES].data = data
+    return bsp.read_ent_data()
+
+
+@pytest.mark.parametrize('newline', [b'\n', b'\r\n', b'\r'], ids=['LF', 'CRLF', 'CR'])
+def test_read_ent_data(newline: bytes) -> None:
+    """Check the entity lump is parsed with each kind of line ending."""
+    vmf = _read_ents(newline.join([
+        b'{',
+        b'"classname" "worldspawn"',
+        b'"mapversion" "42"',
+        b'}',
+        b'{',
+        b'"classname" "info_target"',
+        b'"targetname" "say \\"hi\\""',
+        b'"OnUser1" "!self,Kill,,0,-1"',
+        b'}',
+        b'\x00',
+    ]))
+    assert vmf.spawn['classname'] == 'worldspawn'
+    assert vmf.spawn['mapversion'] == '42'
+    [ent] = vmf.entities
+    assert ent['classname'] == 'info_target'
+    assert ent['targetname'] == 'say "hi"'
+    [out] = ent.outputs
+    assert out.output == 'OnUser1'
+    assert out.target == '!self'
+    assert out.input == 'Kill'
+
+
+@pytest.mark.parametrize('data, message', [
+    (b'{\n"classname" "worldspawn"\n"bad line"\n}\n\x00', 'Invalid keyvalue line'),
+    (b'{\n"classname" "worldspawn"\n\n}\n\x00', 'Invalid keyvalue line'),
+    (b'{\n"classname" "worldspawn"\n}\n\n\x00', 'Keyvalue outside brackets'),
+    (b'"classname" "worldspawn"\n\x00', 'Keyvalue outside brackets'),
+    (b'{\n{\n}\n\x00', '2 levels of nesting'),
+    (b'{\n"classname" "worldspawn"\n}\n}\n\x00', 'Too many closing brackets'),
+    (b'{\n"classname" "worldspawn"\n\x00', "Last entity didn't end"),
+], ids=['bad_kv', 'blank_in_ent', 'blank_outside', 'no_brackets', 'nested', 'extra_close', 'no_end'])
+def test_read_ent_data_invalid(data: bytes, message: str) -> None:
+    """Check invalid entity lumps raise errors."""
+    with pytest.raises(ValueError, match=message):
+        _read_ents(data)
+
+
+def test_static_prop_truncated() -> None:
+    """Check a truncated static prop lump raises an error."""
+    with import_file_path(srctools.test, 'rot_main.bsp') as bsp_path:
+        bsp = BSP(bsp_path)
+    bsp.write_static_props([
+        StaticProp('models/props/crate.mdl', Vec(), Angle(), 1.0, [1, 2, 3], 6),
+    ])
+    data = bsp.game_lumps[b'sprp'].data
+    # Model count, one name, visleaf count, 3 visleafs, then the prop count.
+    leaf_start = 4 + 128 + 4
+    prop_start = leaf_start + 3 * 2 + 4
+
+    for size, message in [
+        (0, 'model count'),
+        (2, 'model count'),
+        (4 + 64, 'model names'),
+        (4 + 128, 'visleaf count'),
+        (4 + 128 + 2, 'visleaf count'),
+        (leaf_start + 4, 'visleafs'),
+        (prop_start - 4, 'prop count'),
+        (prop_start - 1, 'prop count'),
+        (len(data) - 1, 'props'),
+    ]:
+        bsp.game_lumps[b'sprp'].data = data[:size]
+        with pytest.raises(ValueError, match=message):
+            list(bsp.static_props())
+
+
+def test_truncated_header(tmp_path) -> None:
+    """Check a BSP cut off inside the header raises an error."""
+    with import_file_path(srctools.test, 'rot_main.bsp') as bsp_path:
+        with open(bsp_path, 'rb') as f:
+            data = f.read(500)
+    short_path = tmp_path / 'short.bsp'
+    short_path.write_bytes(data)
+    with pytest.raises(ValueError, match='truncated'):
+        BSP(short_path)
+
+
+def test_truncated_game_lump(tmp_path) -> None:
+    """Check a game lump too short for its directory raises an error."""
+    with import_file_path(srctools.test, 'rot_main.bsp') as bsp_path:
+        with open(bsp_path, 'rb') as f:
+            data = bytearray(f.read())
+    # Shrink the game lump to the count and one of its two headers.
+    length_pos = 8 + 16 * BSP_LUMPS.GAME_LUMP.value + 4
+    data[length_pos:length_pos + 4] = (4 + 16).to_bytes(4, 'little')
+    short_path = tmp_path / 'short.bsp'
+    short_path.write_bytes(data)
+    with pytest.raises(ValueError, match='game lump headers'):
+        BSP(short_path)
+
+
+def test_static_prop_tuple_lengths() -> None:
+    """Check tuples which aren't 3 long are converted like Vec() does."""
+    with import_file_path(srctools.test, 'rot_main.bsp') as bsp_path:
+        bsp = BSP(bsp_path)
+    prop = StaticProp(
+        'models/props/crate.mdl',
+        (1, 2, 3, 4),
+        (10, 20, 30, 40),
+        1.0,
+        [],
+        6,
+        lighting_origin=(5, 6),
+        tint=(255, 0, 0, 255),  # RGBA
+    )
+    assert prop.origin == Vec(1, 2, 3)
+    assert prop.angles == Angle(10, 20, 30)
+    assert prop.lighting == Vec(5, 6, 0)
+    assert prop.tint == Vec(255, 0, 0)
+
+    prop.tint = (0, 128, 255, 255)
+    assert prop.tint == Vec(0, 128, 255)
+
+    bsp.game_lumps[b'sprp'].version = 11
+    bsp.write_static_props([prop])
+    [read] = bsp.static_props()
+    assert read.origin == Vec(1, 2, 3)
+    assert read.tint == Vec(0, 128, 255)
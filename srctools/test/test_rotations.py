@@ -327,6 +327,9 @@ def test_gen_check(py_c_vec) -> None:
             assert_rot(Matrix.from_basis(x=x, y=y), mat)
             assert_rot(Matrix.from_basis(y=y, z=z), mat)
             assert_rot(Matrix.from_basis(x=x, z=z), mat)
+            # Skipping normalisation must match for unit vectors.
+            assert_rot(Matrix.from_basis(x=x.norm(), y=y.norm(), z=z.norm(), normalise=False), mat)
+            assert_rot(Matrix.from_basis(x=x.norm(), y=y.norm(), normalise=False), mat)
 
             # Angle.from_basis() == Matrix.from_basis().to_angle().
             assert_ang(Angle.from_basis(x=x, y=y, z=z), *Matrix.from_basis(x=x, y=y, z=z).to_angle())
@@ -507,7 +507,7 @@ class VTF:
         width: int,
         height: int,
         version: Tuple[int, int]=(7, 5),
-        ref: Vec=Vec(0, 0, 0),
+        ref: Optional[Vec]=None,
         frames: int=1,
         bump_scale: float=1.0,
         sheet_info: Mapping[int, 'SheetSequence']=EmptyMapping,
@@ -541,7 +541,8 @@ class VTF:
         self.depth = depth
 
         self.version = version
-        self.reflectivity = ref
+        # Don't share a default Vec between every VTF.
+        self.reflectivity = Vec(0, 0, 0) if ref is None else ref
         self.bumpmap_scale = bump_scale
         self.resources = {}  # type: Dict[Union[ResourceID, bytes], Resource]
         self.sheet_info = dict(sheet_info)